@@ -33,6 +33,7 @@ import logging
 import attr
 import numpy as np
 from vizier import benchmarks
+from vizier import pyvizier as vz
 from vizier._src.algorithms.optimizers import vectorized_base as vb
 from vizier._src.benchmarks.analyzers import simple_regret_score
 from vizier.pyvizier import converters
@@ -46,6 +47,30 @@ class FailedSimpleRegretConvergenceTestError(Exception):
   """Exception raised for simple-regret convergence test fails."""
 
 
+def _run_one_repeat(
+    runner: benchmarks.BenchmarkRunner,
+    baseline_state_factory: benchmarks.BenchmarkStateFactory,
+    candidate_state_factory: benchmarks.BenchmarkStateFactory,
+) -> tuple[list[vz.Trial], list[vz.Trial]]:
+  """Runs baseline and candidate once and returns their trials."""
+  baseline_state = baseline_state_factory()
+  candidate_state = candidate_state_factory()
+
+  # A shared experimenter trivially poses the same problem, so skip copying
+  # and comparing the statements.
+  if baseline_state.experimenter is not candidate_state.experimenter:
+    baseline_statement = baseline_state.experimenter.problem_statement()
+    if baseline_statement != (candidate_statement :=
+                              candidate_state.experimenter.problem_statement()):
+      raise ValueError('Comparison tests done for different statements: '
+                       f'{baseline_statement} vs {candidate_statement}')
+
+  runner.run(baseline_state)
+  runner.run(candidate_state)
+  return (baseline_state.algorithm.supporter.GetTrials(),
+          candidate_state.algorithm.supporter.GetTrials())
+
+
 @attr.define
 class EfficiencyComparisonTester:
   """Comparison test between algorithms using analysis scores."""
@@ -66,34 +91,23 @@ class EfficiencyComparisonTester:
         benchmark_subroutines=[benchmarks.GenerateAndEvaluate()],
         num_repeats=self.num_trials)
 
-    baseline_curves = []
-    candidate_curves = []
+    baseline_statement = baseline_state_factory.experimenter.problem_statement()
+    if len(baseline_statement.metric_information) > 1:
+      raise ValueError('Support for multimetric is not yet')
+    # Shared across all repeats and both algorithms.
+    converter = benchmarks.ConvergenceCurveConverter(
+        baseline_statement.metric_information.item())
+
+    baseline_trials_by_repeat = []
+    candidate_trials_by_repeat = []
     for _ in range(self.num_repeats):
-      baseline_state = baseline_state_factory()
-      candidate_state = candidate_state_factory()
-
-      baseline_statement = baseline_state.experimenter.problem_statement()
-      if len(baseline_statement.metric_information) > 1:
-        raise ValueError('Support for multimetric is not yet')
-      if baseline_statement != (
-          candidate_statement :=
-          candidate_state.experimenter.problem_statement()):
-        raise ValueError('Comparison tests done for different statements: '
-                         f'{baseline_statement} vs {candidate_statement}')
-
-      runner.run(baseline_state)
-      runner.run(candidate_state)
-      baseline_curves.append(
-          benchmarks.ConvergenceCurveConverter(
-              baseline_statement.metric_information.item()).convert(
-                  baseline_state.algorithm.supporter.GetTrials()))
-      candidate_curves.append(
-          benchmarks.ConvergenceCurveConverter(
-              baseline_statement.metric_information.item()).convert(
-                  candidate_state.algorithm.supporter.GetTrials()))
-
-    baseline_curve = benchmarks.ConvergenceCurve.align_xs(baseline_curves)
-    candidate_curve = benchmarks.ConvergenceCurve.align_xs(candidate_curves)
+      baseline_trials, candidate_trials = _run_one_repeat(
+          runner, baseline_state_factory, candidate_state_factory)
+      baseline_trials_by_repeat.append(baseline_trials)
+      candidate_trials_by_repeat.append(candidate_trials)
+
+    baseline_curve = converter.convert_batch(baseline_trials_by_repeat)
+    candidate_curve = converter.convert_batch(candidate_trials_by_repeat)
     comparator = benchmarks.ConvergenceCurveComparator(baseline_curve)
 
     if (log_eff_score :=
@@ -139,26 +153,26 @@ class SimpleRegretComparisonTester:
   ) -> None:
     """Assert if candidate optimizer has better simple regret than the baseline.
     """
-    baseline_simple_regrets = []
-    candidate_simple_regrets = []
+    baseline_simple_regrets = np.empty(self.baseline_num_repeats)
+    candidate_simple_regrets = np.empty(self.candidate_num_repeats)
 
-    for _ in range(self.baseline_num_repeats):
+    for i in range(self.baseline_num_repeats):
       trial = baseline_optimizer.optimize(
           converter,
           score_fn,
           count=1,
           max_evaluations=self.baseline_num_trials)
       simple_regret = trial[0].final_measurement.metrics['acquisition'].value
-      baseline_simple_regrets.append(simple_regret)
+      baseline_simple_regrets[i] = simple_regret
 
-    for _ in range(self.candidate_num_repeats):
+    for i in range(self.candidate_num_repeats):
       trial = candidate_optimizer.optimize(
           converter,
           score_fn,
           count=1,
           max_evaluations=self.candidate_num_trials)
       simple_regret = trial[0].final_measurement.metrics['acquisition'].value
-      candidate_simple_regrets.append(simple_regret)
+      candidate_simple_regrets[i] = simple_regret
 
     p_value = simple_regret_score.t_test_less_mean_score(
         baseline_simple_regrets, candidate_simple_regrets)
@@ -169,7 +183,7 @@ class SimpleRegretComparisonTester:
       logging.info('Convergence test PASSED:\n %s', msg)
 
     else:
-      raise FailedSimpleRegretConvergenceTestError(msg)
+      raise FailedSimpleRegretConvergenceTestError(str(msg))
 
   def assert_benchmark_state_better_simple_regret(
       self,
@@ -195,17 +209,17 @@ class SimpleRegretComparisonTester:
       ).single_objective_metric_name
       return best_trial.final_measurement.metrics[metric_name].value
 
-    baseline_simple_regrets = []
-    candidate_simple_regrets = []
+    baseline_simple_regrets = np.empty(self.baseline_num_repeats)
+    candidate_simple_regrets = np.empty(self.candidate_num_repeats)
 
-    for _ in range(self.baseline_num_repeats):
-      baseline_simple_regrets.append(
-          _run_one(baseline_benchmark_state_factory, self.baseline_num_trials,
-                   baseline_batch_size))
-    for _ in range(self.candidate_num_repeats):
-      candidate_simple_regrets.append(
-          _run_one(candidate_benchmark_state_factory, self.candidate_num_trials,
-                   candidate_batch_size))
+    for i in range(self.baseline_num_repeats):
+      baseline_simple_regrets[i] = _run_one(baseline_benchmark_state_factory,
+                                            self.baseline_num_trials,
+                                            baseline_batch_size)
+    for i in range(self.candidate_num_repeats):
+      candidate_simple_regrets[i] = _run_one(candidate_benchmark_state_factory,
+                                             self.candidate_num_trials,
+                                             candidate_batch_size)
 
     p_value = simple_regret_score.t_test_less_mean_score(
         baseline_simple_regrets, candidate_simple_regrets)
@@ -215,23 +229,43 @@ class SimpleRegretComparisonTester:
       logging.info('Convergence test PASSED:\n %s', msg)
 
     else:
-      raise FailedSimpleRegretConvergenceTestError(msg)
+      raise FailedSimpleRegretConvergenceTestError(str(msg))
 
   def _generate_summary(
       self,
-      baseline_simple_regrets: list[float],
-      candidate_simple_regrets: list[float],
+      baseline_simple_regrets: np.ndarray,
+      candidate_simple_regrets: np.ndarray,
       p_value: float,
-  ) -> str:
-    """Generate summary message."""
-    baseline_mean = np.mean(baseline_simple_regrets)
-    baseline_std = np.std(baseline_simple_regrets)
-    candidate_mean = np.mean(candidate_simple_regrets)
-    candidate_std = np.std(candidate_simple_regrets)
-    return (f'P-value={p_value}. Alpha={self.alpha}.'
+  ) -> '_SimpleRegretSummary':
+    """Generate summary message, which is only formatted when needed."""
+    return _SimpleRegretSummary(baseline_simple_regrets,
+                                candidate_simple_regrets, p_value, self.alpha)
+
+
+def _mean_std(x: np.ndarray) -> tuple[float, float]:
+  """Returns the mean and population std, reusing the mean for the std."""
+  mean = x.mean()
+  return mean, np.sqrt(np.square(x - mean).mean())
+
+
+@attr.define
+class _SimpleRegretSummary:
+  """Simple-regret summary whose statistics are computed on `str()`."""
+  baseline_simple_regrets: np.ndarray
+  candidate_simple_regrets: np.ndarray
+  p_value: float
+  alpha: float
+
+  def __str__(self) -> str:
+    baseline_mean, baseline_std = _mean_std(self.baseline_simple_regrets)
+    candidate_mean, candidate_std = _mean_std(self.candidate_simple_regrets)
+    return (f'P-value={self.p_value}. Alpha={self.alpha}.'
             f'\nBaseline Simple Regret Mean: {baseline_mean}.'
             f'\nBaseline Simple Regret Std: {baseline_std}.'
             f'\nCandidate Simple Regret Mean: {candidate_mean}.'
             f'\nCandidate Simple Regret Std: {candidate_std}.'
-            f'\nBaseline Simple Regret Scores: {baseline_simple_regrets}'
-            f'\nCandidate Simple Regret Scores: {candidate_simple_regrets}')
+            # Scores are printed as lists, e.g. [1.0, 2.0] rather than [1. 2.].
+            '\nBaseline Simple Regret Scores: '
+            f'{self.baseline_simple_regrets.tolist()}'
+            '\nCandidate Simple Regret Scores: '
+            f'{self.candidate_simple_regrets.tolist()}')
@@ -116,6 +116,24 @@ class EfficiencyConvergenceTest(absltest.TestCase):
           benchmarks.DesignerBenchmarkStateFactory(
               experimenter=experimenter, designer_factory=_good_designer))
 
+  def test_comparison_on_different_statements_fails(self):
+
+    def _designer(problem: vz.ProblemStatement) -> vza.Designer:
+      return DummyDesigner(problem.search_space)
+
+    comparator = comparator_runner.EfficiencyComparisonTester(
+        num_trials=1, num_repeats=1)
+    with self.assertRaisesRegex(ValueError, 'different statements'):
+      comparator.assert_better_efficiency(
+          benchmarks.DesignerBenchmarkStateFactory(
+              experimenter=benchmarks.NumpyExperimenter(
+                  bbob.Sphere, bbob.DefaultBBOBProblemStatement(3)),
+              designer_factory=_designer),
+          benchmarks.DesignerBenchmarkStateFactory(
+              experimenter=benchmarks.NumpyExperimenter(
+                  bbob.Sphere, bbob.DefaultBBOBProblemStatement(4)),
+              designer_factory=_designer))
+
 
 class SimpleRegretConvergenceRunnerTest(parameterized.TestCase):
   """Test suite for convergence runner."""
@@ -244,5 +262,25 @@ class SimpleRegretConvergenceRunnerTest(parameterized.TestCase):
         )
 
 
+  def test_failure_message_lists_scores(self):
+    simple_regret_test = comparator_runner.SimpleRegretComparisonTester(
+        baseline_num_trials=100,
+        candidate_num_trials=100,
+        baseline_num_repeats=2,
+        candidate_num_repeats=2,
+        alpha=0.05)
+    with self.assertRaisesRegex(  # pylint: disable=g-error-prone-assert-raises
+        comparator_runner.FailedSimpleRegretConvergenceTestError,
+        r'Baseline Simple Regret Scores: \[1\.0, 1\.0\]'
+        r'\nCandidate Simple Regret Scores: \[0\.0, 0\.0\]'):
+      simple_regret_test.assert_optimizer_better_simple_regret(
+          self.converter,
+          lambda x: np.sum(x, axis=-1),
+          vb.VectorizedOptimizer(
+              strategy_factory=lambda *_: DummyVectorizedStrategy(1.0)),
+          vb.VectorizedOptimizer(
+              strategy_factory=lambda *_: DummyVectorizedStrategy(0.0)),
+      )
+
 if __name__ == '__main__':
   absltest.main()
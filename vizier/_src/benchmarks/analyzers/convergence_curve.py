@@ -70,6 +70,10 @@ class ConvergenceCurve:
 
     all_ys = []
     for curve in curves:
+      if np.array_equal(curve.xs, xs):
+        # Already on the aligned xs, so the rows can be used as is.
+        all_ys.extend(np.asarray(curve.ys, dtype=float))
+        continue
       for ys in curve.ys:
         all_ys.append(np.interp(xs, curve.xs, ys, right=np.nan))
 
@@ -116,34 +120,90 @@ class ConvergenceCurveConverter:
     xvals = [0]
     comparator = self.comparator
     for trial in trials:
-      candidates = [np.nan]
-      if self.measurements_type in ('final', 'all'):
-        if trial.final_measurement and (self.metric_information.name
-                                        in trial.final_measurement.metrics):
-          candidates.append(trial.final_measurement.metrics[
-              self.metric_information.name].value)
-      if self.measurements_type in ('intermediate', 'all'):
-        for measurement in trial.measurements:
-          if self.metric_information.name in measurement.metrics:
-            candidates.append(
-                measurement.metrics[self.metric_information.name].value)
-
-      yvalue = comparator(candidates)
+      yvalue = self._get_trial_value(trial)
       xvals.append(xvals[-1] + self.cost_fn(trial))
       yvals.append(comparator([yvalue, yvals[-1]]))
 
     yvals = np.asarray(yvals[1:])
-    trend = ConvergenceCurve.YTrend.DECREASING
-    if (self.metric_information.goal == pyvizier.ObjectiveMetricGoal.MAXIMIZE
-       ) or (self.metric_information.goal
-             == pyvizier.ObjectiveMetricGoal.MINIMIZE and self.flip_signs):
-      trend = ConvergenceCurve.YTrend.INCREASING
     return ConvergenceCurve(
         xs=np.asarray(xvals[1:]),
         ys=np.asarray(yvals).reshape([1, -1]) * (-1 if self.flip_signs else 1),
-        trend=trend,
+        trend=self._trend,
+        ylabel=self.metric_information.name)
+
+  def convert_batch(
+      self,
+      trials_by_repeat: Sequence[Sequence[pyvizier.Trial]]) -> ConvergenceCurve:
+    """Returns ConvergenceCurve whose batch size is len(trials_by_repeat).
+
+    When all sequences share the same cost axis, it is used as the float xs
+    without resampling, and the metric values are stacked into a [N x T] array
+    and accumulated in a single vectorized pass. Otherwise, the per-sequence
+    curves are aligned with `ConvergenceCurve.align_xs`.
+
+    Args:
+      trials_by_repeat: Sequence of Trial sequences, one per repeat.
+
+    Returns:
+      ConvergenceCurve with one row per Trial sequence.
+    """
+    if not trials_by_repeat:
+      raise ValueError('Empty sequence of trials.')
+    xs_by_repeat = [
+        np.cumsum([self.cost_fn(trial) for trial in trials], dtype=float)
+        for trials in trials_by_repeat
+    ]
+    values_by_repeat = [
+        np.asarray([self._get_trial_value(trial) for trial in trials],
+                   dtype=float) for trials in trials_by_repeat
+    ]
+    # fmax/fmin ignore NaNs, matching the nanmax/nanmin comparator.
+    accumulator = np.fmax if (self.metric_information.goal
+                              == pyvizier.ObjectiveMetricGoal.MAXIMIZE
+                             ) else np.fmin
+    sign = -1 if self.flip_signs else 1
+
+    xs = xs_by_repeat[0]
+    if any(not np.array_equal(xs, other) for other in xs_by_repeat[1:]):
+      return ConvergenceCurve.align_xs([
+          ConvergenceCurve(
+              xs=other_xs,
+              ys=accumulator.accumulate(values).reshape([1, -1]) * sign,
+              trend=self._trend,
+              ylabel=self.metric_information.name)
+          for other_xs, values in zip(xs_by_repeat, values_by_repeat)
+      ])
+
+    ys = accumulator.accumulate(np.stack(values_by_repeat), axis=1)
+    return ConvergenceCurve(
+        xs=xs,
+        ys=ys * sign,
+        trend=self._trend,
         ylabel=self.metric_information.name)
 
+  def _get_trial_value(self, trial: pyvizier.Trial) -> float:
+    """Returns the best metric value of the Trial's relevant measurements."""
+    candidates = [np.nan]
+    if self.measurements_type in ('final', 'all'):
+      if trial.final_measurement and (self.metric_information.name
+                                      in trial.final_measurement.metrics):
+        candidates.append(trial.final_measurement.metrics[
+            self.metric_information.name].value)
+    if self.measurements_type in ('intermediate', 'all'):
+      for measurement in trial.measurements:
+        if self.metric_information.name in measurement.metrics:
+          candidates.append(
+              measurement.metrics[self.metric_information.name].value)
+    return self.comparator(candidates)
+
+  @property
+  def _trend(self) -> ConvergenceCurve.YTrend:
+    if (self.metric_information.goal == pyvizier.ObjectiveMetricGoal.MAXIMIZE
+       ) or (self.metric_information.goal
+             == pyvizier.ObjectiveMetricGoal.MINIMIZE and self.flip_signs):
+      return ConvergenceCurve.YTrend.INCREASING
+    return ConvergenceCurve.YTrend.DECREASING
+
   @property
   def comparator(self):
     """Comparator used for creating the convergence curve."""
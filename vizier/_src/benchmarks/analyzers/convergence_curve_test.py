@@ -65,6 +65,22 @@ class ConvergenceCurveTest(absltest.TestCase):
     np.testing.assert_array_equal(aligned.ys,
                                   np.array([[2, 1.25, 1], [3, np.nan, np.nan]]))
 
+  def test_align_xs_on_shared_xs(self):
+    c1 = convergence.ConvergenceCurve(
+        xs=np.array([1, 2, 3]),
+        ys=np.array([[2, 1, 1], [3, 3, 2]]),
+        trend=convergence.ConvergenceCurve.YTrend.DECREASING)
+    c2 = convergence.ConvergenceCurve(
+        xs=np.array([1, 2, 3]),
+        ys=np.array([[4, 2, 0]]),
+        trend=convergence.ConvergenceCurve.YTrend.DECREASING)
+    aligned = convergence.ConvergenceCurve.align_xs([c1, c2])
+
+    np.testing.assert_array_equal(aligned.xs, [1, 2, 3])
+    np.testing.assert_array_equal(aligned.ys,
+                                  np.array([[2, 1, 1], [3, 3, 2], [4, 2, 0]]))
+    self.assertEqual(aligned.ys.dtype, np.float64)
+
   def test_align_xs_on_increasing_and_dicreasing_fails(self):
     c1 = convergence.ConvergenceCurve(
         xs=np.array([1, 3, 4]),
@@ -91,6 +107,47 @@ class ConvergenceCurveConverterTest(parameterized.TestCase):
     np.testing.assert_array_equal(curve.xs, [1, 2, 3])
     np.testing.assert_array_equal(curve.ys, expected)
 
+  @parameterized.named_parameters(
+      ('maximize', pyvizier.ObjectiveMetricGoal.MAXIMIZE,
+       [[2, 2, 3], [1, 4, 4]]),
+      ('minimize', pyvizier.ObjectiveMetricGoal.MINIMIZE,
+       [[2, 1, 1], [1, 1, 0]]))
+  def test_convert_batch(self, goal, expected):
+    trials_by_repeat = [_gen_trials([2, 1, 3]), _gen_trials([1, 4, 0])]
+    generator = convergence.ConvergenceCurveConverter(
+        pyvizier.MetricInformation(name='', goal=goal))
+    curve = generator.convert_batch(trials_by_repeat)
+    np.testing.assert_array_equal(curve.xs, [1, 2, 3])
+    np.testing.assert_array_equal(curve.ys, expected)
+
+    aligned = convergence.ConvergenceCurve.align_xs(
+        [generator.convert(trials) for trials in trials_by_repeat])
+    np.testing.assert_array_equal(curve.xs, aligned.xs)
+    self.assertEqual(curve.xs.dtype, aligned.xs.dtype)
+    np.testing.assert_array_equal(curve.ys, aligned.ys)
+    self.assertEqual(curve.trend, aligned.trend)
+
+  def test_convert_batch_on_shared_nonuniform_costs(self):
+    trials_by_repeat = [_gen_trials([2, 1, 3]), _gen_trials([1, 4, 0])]
+    costs = iter([1, 3, 4] * 2)
+    generator = convergence.ConvergenceCurveConverter(
+        pyvizier.MetricInformation(
+            name='', goal=pyvizier.ObjectiveMetricGoal.MINIMIZE),
+        cost_fn=lambda _: next(costs))
+    curve = generator.convert_batch(trials_by_repeat)
+    # Shared cost axes are not resampled.
+    np.testing.assert_array_equal(curve.xs, [1.0, 4.0, 8.0])
+    np.testing.assert_array_equal(curve.ys, [[2, 1, 1], [1, 1, 0]])
+
+  def test_convert_batch_on_different_lengths(self):
+    generator = convergence.ConvergenceCurveConverter(
+        pyvizier.MetricInformation(
+            name='', goal=pyvizier.ObjectiveMetricGoal.MINIMIZE))
+    curve = generator.convert_batch([_gen_trials([2, 1, 3]), _gen_trials([3])])
+    np.testing.assert_array_equal(curve.xs, [1, 2, 3])
+    np.testing.assert_array_equal(curve.ys,
+                                  np.array([[2, 1, 1], [3, np.nan, np.nan]]))
+
 
 class ConvergenceComparatorTest(absltest.TestCase):
 
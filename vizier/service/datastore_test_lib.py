@@ -32,7 +32,7 @@ UnitMetadataUpdate = vizier_service_pb2.UnitMetadataUpdate
 
 
 def make_random_string() -> str:
-  return ''.join(random.choice(string.ascii_lowercase) for _ in range(10))
+  return ''.join(random.choices(string.ascii_lowercase, k=10))
 
 
 class DataStoreTestCase(parameterized.TestCase):